@@ -9,14 +9,70 @@ API Version: 1.0.0
 
 import time
 import logging
-from datetime import datetime
-from typing import Dict, Any, Tuple
+from datetime import datetime, timezone
+from typing import Dict, Any, NamedTuple, Tuple
 from src.plugin_system.base_plugin import BasePlugin
 
 try:
-    import pytz
+    from zoneinfo import ZoneInfo
 except ImportError:
-    pytz = None
+    ZoneInfo = None
+
+
+class _ClockLayout(NamedTuple):
+    """Pixel positions for one display size and font (see SimpleClock._get_layout)."""
+    width: int
+    height: int
+    font_height: int
+    time_y: int
+    ampm_spacing: int
+    weekday_y: int          # OLD_CLOCK weekday line
+    two_line_date_y: int    # OLD_CLOCK month/day line
+    date_y: int             # single-line date formats
+
+
+# Maximum number of memoized text widths; with seconds shown the time string
+# changes every second, so the cache must not grow without bound
+_TEXT_WIDTH_CACHE_SIZE = 64
+
+# pytz is only needed when zoneinfo is missing or doesn't know a timezone, so it
+# is imported on first use (see _load_pytz) rather than at plugin load
+_NOT_LOADED = object()
+_pytz = _NOT_LOADED
+
+
+def _load_pytz():
+    """Import pytz on first use, returning None if it is not installed."""
+    global _pytz
+    if _pytz is _NOT_LOADED:
+        try:
+            import pytz
+        except ImportError:
+            pytz = None
+        _pytz = pytz
+    return _pytz
+
+
+# English month and weekday names for the OLD_CLOCK layout (match strftime('%B') /
+# strftime('%A') in the C locale); weekdays are indexed by datetime.weekday()
+_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+_WEEKDAY_NAMES = (
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+)
+
+# 12-hour indicator, indexed by (hour >= 12)
+_AMPM = ('AM', 'PM')
+
+# Ordinal suffix for each day of the month, indexed by day (index 0 is unused)
+_ORDINAL_SUFFIX = (
+    'th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th',   # 0-9
+    'th', 'th', 'th', 'th', 'th', 'th', 'th', 'th', 'th', 'th',   # 10-19
+    'th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th',   # 20-29
+    'th', 'st'                                                    # 30-31
+)
 
 
 class SimpleClock(BasePlugin):
@@ -36,6 +92,13 @@ class SimpleClock(BasePlugin):
             - ampm_text: Font and color settings for AM/PM indicator
     """
 
+    # Color attributes checked by validate_config()
+    _COLOR_ATTRS = ("time_color", "date_color", "ampm_color")
+
+    # Resolved tzinfo objects by name, so repeat lookups skip zoneinfo/pytz while
+    # this module stays loaded (a plugin reload starts with an empty cache)
+    _TZ_CACHE: Dict[str, Any] = {}
+
     def __init__(self, plugin_id: str, config: Dict[str, Any],
                  display_manager, cache_manager, plugin_manager):
         """Initialize the clock plugin."""
@@ -57,7 +120,9 @@ class SimpleClock(BasePlugin):
         self.center_time_with_ampm = config.get('center_time_with_ampm', False)
         self.date_format = config.get('date_format', 'OLD_CLOCK')
 
-        # Colors from nested customization, with fallback to defaults
+        # Colors from nested customization, with fallback to defaults.
+        # Valid colors are normalized to (int, int, int) tuples here so neither
+        # validate_config nor the renderer has to coerce them again.
         def _parse_color(color_value, default):
             if color_value is None:
                 return default
@@ -77,9 +142,9 @@ class SimpleClock(BasePlugin):
         date_text = customization.get('date_text', {})
         ampm_text = customization.get('ampm_text', {})
 
-        self.time_color = _parse_color(time_text.get('text_color'), [255, 255, 255])
-        self.date_color = _parse_color(date_text.get('text_color'), [255, 128, 64])
-        self.ampm_color = _parse_color(ampm_text.get('text_color'), [255, 255, 128])
+        self.time_color = _parse_color(time_text.get('text_color'), (255, 255, 255))
+        self.date_color = _parse_color(date_text.get('text_color'), (255, 128, 64))
+        self.ampm_color = _parse_color(ampm_text.get('text_color'), (255, 255, 128))
 
         # Position - use flattened keys
         self.pos_x = config.get('position_x', 0)
@@ -88,14 +153,81 @@ class SimpleClock(BasePlugin):
         # Get timezone
         self.timezone = self._get_timezone()
 
+        # Date formatter for the configured date_format; unknown formats fall back to MM/DD/YYYY
+        date_formatters = {
+            "MM/DD/YYYY": lambda dt: f"{dt.month:02d}/{dt.day:02d}/{dt.year}",
+            "DD/MM/YYYY": lambda dt: f"{dt.day:02d}/{dt.month:02d}/{dt.year}",
+            "YYYY-MM-DD": lambda dt: f"{dt.year}-{dt.month:02d}-{dt.day:02d}",
+            "OLD_CLOCK": self._format_date_old_clock,
+        }
+        self._format_date_impl = date_formatters.get(self.date_format, date_formatters["MM/DD/YYYY"])
+
+        # Resolve formatting and layout choices once; these options are fixed
+        # for the plugin's lifetime
+        show_ampm = self.time_format == "12h"
+        self._format_time_impl = self._format_time_12h if show_ampm else self._format_time_24h
+        self._center_ampm_block = show_ampm and self.center_time_with_ampm
+        self._show_weekday = self.show_date and self.date_format == "OLD_CLOCK"
+        if self._center_ampm_block:
+            self._draw_time_impl = self._draw_time_centered_with_ampm
+        elif show_ampm:
+            self._draw_time_impl = self._draw_time_with_ampm
+        else:
+            self._draw_time_impl = self._draw_time_only
+        if not self.show_date:
+            self._draw_date_impl = None
+        elif self._show_weekday:
+            self._draw_date_impl = self._draw_date_old_clock
+        else:
+            self._draw_date_impl = self._draw_date_single_line
+
+        # Values produced by update(); empty until the first successful update
+        self.current_time = ''
+        self.time_without_seconds = ''
+        self.current_ampm = ''
+        self.current_date = ''
+        self.current_weekday = ''
+        self.current_seconds = None
+        self.current_dt = None
+        self.last_update = 0.0
+        self._last_time_log = float('-inf')  # time.monotonic() of the last throttled log
+        self._date_ordinal = None  # Calendar day that current_date was formatted for
+
         # Track last display for optimization
         self.last_time_str = None
-        self.last_time_without_seconds = None  # Track time without seconds for comparison
-        self.last_ampm_str = None
-        self.last_date_str = None
-        self.last_weekday_str = None
+        # (time without seconds, AM/PM, date, weekday) as last drawn; None forces a redraw
+        self._last_display_key = None
+        # Second (or minute) that display() last handled; -1 forces a check
+        self._display_tick = -1
         self.last_seconds = None  # Track seconds separately
 
+        # Element positions, recomputed when the display size or font changes
+        self._layout = None
+        self._layout_key = None
+
+        # update() and display() only do work once per "tick": the smallest unit
+        # of time shown (seconds if shown, else minutes)
+        self._tick_period = 1 if self.show_seconds else 60
+        # Last tick that update() formatted
+        self._last_tick = -1
+
+        # Pixel widths of strings drawn in small_font, keyed by text; cleared
+        # whenever display_manager.small_font is replaced
+        self._text_width_cache = {}
+        self._text_width_font = None
+
+        # Result of validate_config(), computed on first call
+        self._config_valid = None
+
+        # get_info() fields that never change after __init__
+        self._static_info = {
+            'timezone': self.timezone_str,
+            'time_format': self.time_format,
+            'show_seconds': self.show_seconds,
+            'show_date': self.show_date,
+            'date_format': self.date_format
+        }
+
         self.logger.info(f"Clock plugin initialized for timezone: {self.timezone_str}")
 
     def _get_global_timezone(self) -> str:
@@ -112,64 +244,123 @@ class SimpleClock(BasePlugin):
         return 'UTC'
 
     def _get_timezone(self):
-        """Get timezone from configuration."""
-        if pytz is None:
-            self.logger.warning("pytz not available, using UTC timezone only")
+        """
+        Get timezone from configuration, preferring the stdlib zoneinfo database.
+
+        Also records the outcome in self._timezone_valid for validate_config():
+        True if the name resolved, False if it was invalid, None if no tz database
+        was available to check it.
+        """
+        tz = self._lookup_timezone(self.timezone_str)
+        if tz is not None:
+            self._timezone_valid = True
+            return tz
+
+        # An unknown name and a missing tz database both fail the lookup; only the
+        # former means the configured name is wrong
+        if not self._tz_database_available():
+            self._timezone_valid = None
+            self.logger.warning("No timezone database available (install tzdata or pytz), using system local time")
             return None
 
-        try:
-            return pytz.timezone(self.timezone_str)
-        except Exception:
-            self.logger.warning(
-                f"Invalid timezone '{self.timezone_str}'. Falling back to UTC. "
-                "Valid timezones can be found at: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones"
-            )
-            return pytz.utc
+        self._timezone_valid = False
+        self.logger.warning(
+            f"Invalid timezone '{self.timezone_str}'. Falling back to UTC. "
+            "Valid timezones can be found at: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones"
+        )
+        return timezone.utc
+
+    def _lookup_timezone(self, name: str):
+        """Resolve a tz database name via zoneinfo, then pytz. Returns None if neither knows it."""
+        # Only strings can be cache keys; anything else (e.g. a list from a hand-edited
+        # config) falls through to the lookups below and is reported as invalid
+        cacheable = isinstance(name, str)
+        tz = self._TZ_CACHE.get(name) if cacheable else None
+        if tz is not None:
+            return tz
+
+        if ZoneInfo is not None:
+            try:
+                tz = ZoneInfo(name)
+            except Exception:
+                pass  # pytz bundles its own tz database, so give it a chance
+
+        if tz is None:
+            pytz = _load_pytz()
+            if pytz is not None:
+                try:
+                    tz = pytz.timezone(name)
+                except Exception:
+                    pass
+
+        if tz is not None and cacheable:
+            self._TZ_CACHE[name] = tz
+        return tz
+
+    def _tz_database_available(self) -> bool:
+        """Check whether zoneinfo or pytz has tz data to resolve names against."""
+        if ZoneInfo is not None:
+            try:
+                ZoneInfo('UTC')
+                return True
+            except Exception:
+                pass  # zoneinfo imported, but there is no system tz database or tzdata package
+        return _load_pytz() is not None
 
     def _format_time_12h(self, dt: datetime) -> Tuple[str, str]:
         """Format time in 12-hour format."""
-        time_str = dt.strftime("%I:%M")
+        # Hour without leading zero, 12 for midnight/noon
+        time_str = f"{dt.hour % 12 or 12}:{dt.minute:02d}"
         if self.show_seconds:
-            time_str += dt.strftime(":%S")
+            time_str += f":{dt.second:02d}"
 
-        # Remove leading zero from hour
-        if time_str.startswith("0"):
-            time_str = time_str[1:]
-
-        ampm = dt.strftime("%p")
+        ampm = _AMPM[dt.hour >= 12]
         return time_str, ampm
 
-    def _format_time_24h(self, dt: datetime) -> str:
-        """Format time in 24-hour format."""
-        time_str = dt.strftime("%H:%M")
+    def _format_time_24h(self, dt: datetime) -> Tuple[str, str]:
+        """Format time in 24-hour format (AM/PM is always empty)."""
+        time_str = f"{dt.hour:02d}:{dt.minute:02d}"
         if self.show_seconds:
-            time_str += dt.strftime(":%S")
-        return time_str
+            time_str += f":{dt.second:02d}"
+        return time_str, ""
+
+    def _get_text_width(self, text: str) -> int:
+        """Get the width of text in small_font, memoized by string."""
+        font = self.display_manager.small_font
+        cache = self._text_width_cache
+        if font is not self._text_width_font:
+            # Widths measured with a different font object are stale
+            cache.clear()
+            self._text_width_font = font
+        width = cache.get(text)
+        if width is None:
+            width = self.display_manager.get_text_width(text, font)
+            if len(cache) >= _TEXT_WIDTH_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del cache[next(iter(cache))]
+            cache[text] = width
+        return width
 
     def _get_ordinal_suffix(self, day: int) -> str:
         """Get the ordinal suffix for a day number (1st, 2nd, 3rd, etc.)."""
-        if 10 <= day % 100 <= 20:
-            suffix = 'th'
-        else:
-            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
-        return suffix
+        return _ORDINAL_SUFFIX[day]
 
     def _format_date(self, dt: datetime) -> str:
         """Format date according to configured format."""
-        if self.date_format == "MM/DD/YYYY":
-            return dt.strftime("%m/%d/%Y")
-        elif self.date_format == "DD/MM/YYYY":
-            return dt.strftime("%d/%m/%Y")
-        elif self.date_format == "YYYY-MM-DD":
-            return dt.strftime("%Y-%m-%d")
-        elif self.date_format == "OLD_CLOCK":
-            # Match old clock format: "Month Day" with ordinal suffix (no leading zero on day)
-            # This matches the original clock.py: current.strftime(f'%B %-d{day_suffix}')
-            day_suffix = self._get_ordinal_suffix(dt.day)
-            # Use day integer directly (no leading zero) to match original clock.py format
-            return dt.strftime(f'%B {dt.day}{day_suffix}')
-        else:
-            return dt.strftime("%m/%d/%Y")  # fallback
+        return self._format_date_impl(dt)
+
+    def _format_date_old_clock(self, dt: datetime) -> str:
+        """Format date as "Month Day" with ordinal suffix (no leading zero on day)."""
+        # This matches the original clock.py: current.strftime(f'%B %-d{day_suffix}')
+        return f"{_MONTH_NAMES[dt.month - 1]} {dt.day}{self._get_ordinal_suffix(dt.day)}"
+
+    def _throttled_log(self, msg: str, *args) -> None:
+        """Log at INFO level at most once every 60 seconds."""
+        # Monotonic so wall-clock steps (NTP sync, manual changes) can't stall the throttle
+        now = time.monotonic()
+        if now - self._last_time_log > 60:
+            self.logger.info(msg, *args)
+            self._last_time_log = now
 
     def update(self) -> None:
         """
@@ -179,11 +370,16 @@ class SimpleClock(BasePlugin):
         prepare the current time for display optimization.
         """
         try:
+            # Skip formatting until the displayed resolution rolls over
+            now = time.time()
+            tick = int(now // self._tick_period)
+            if tick == self._last_tick:
+                return
+
             # Get current time
-            if pytz and self.timezone:
-                # Use timezone-aware datetime
-                utc_now = datetime.now(pytz.utc)
-                local_time = utc_now.astimezone(self.timezone)
+            if self.timezone is not None:
+                # Use timezone-aware datetime (tzinfo.fromutc does the conversion)
+                local_time = datetime.now(self.timezone)
             else:
                 # Use local system time (no timezone conversion)
                 local_time = datetime.now()
@@ -194,48 +390,35 @@ class SimpleClock(BasePlugin):
             # Get current seconds for comparison
             current_seconds = local_time.second
             
-            if self.time_format == "12h":
-                new_time, new_ampm = self._format_time_12h(local_time)
-                # Store time without seconds for comparison
-                if self.show_seconds:
-                    # Remove seconds portion for comparison (format: "H:MM:SS" or "H:MM")
-                    time_without_seconds = new_time.rsplit(':', 1)[0] if ':' in new_time else new_time
-                else:
-                    time_without_seconds = new_time
-                
-                # Only log if the time (without seconds) actually changed
-                if not hasattr(self, 'current_time') or time_without_seconds != getattr(self, 'time_without_seconds', ''):
-                    if not hasattr(self, '_last_time_log') or time.time() - getattr(self, '_last_time_log', 0) > 60:
-                        self.logger.info(f"Clock updated: {new_time} {new_ampm}")
-                        self._last_time_log = time.time()
-                self.current_time = new_time
-                self.time_without_seconds = time_without_seconds
-                self.current_ampm = new_ampm
+            new_time, new_ampm = self._format_time_impl(local_time)
+            # Store time without seconds for comparison
+            if self.show_seconds:
+                # Remove seconds portion for comparison (format: "H:MM:SS" or "H:MM")
+                time_without_seconds = new_time.rsplit(':', 1)[0] if ':' in new_time else new_time
             else:
-                new_time = self._format_time_24h(local_time)
-                # Store time without seconds for comparison
-                if self.show_seconds:
-                    # Remove seconds portion for comparison (format: "HH:MM:SS" or "HH:MM")
-                    time_without_seconds = new_time.rsplit(':', 1)[0] if ':' in new_time else new_time
-                else:
-                    time_without_seconds = new_time
-                
-                if not hasattr(self, 'current_time') or time_without_seconds != getattr(self, 'time_without_seconds', ''):
-                    if not hasattr(self, '_last_time_log') or time.time() - getattr(self, '_last_time_log', 0) > 60:
-                        self.logger.info(f"Clock updated: {new_time}")
-                        self._last_time_log = time.time()
-                self.current_time = new_time
-                self.time_without_seconds = time_without_seconds
+                time_without_seconds = new_time
+
+            # Only log if the time (without seconds) actually changed
+            if time_without_seconds != self.time_without_seconds:
+                self._throttled_log("Clock updated: %s%s", new_time, " " + new_ampm if new_ampm else "")
+            self.current_time = new_time
+            self.time_without_seconds = time_without_seconds
+            self.current_ampm = new_ampm
 
             if self.show_date:
-                self.current_date = self._format_date(local_time)
-                # Also get weekday for old clock layout
-                self.current_weekday = local_time.strftime('%A')
+                # Date strings only change once per calendar day
+                day_ordinal = local_time.toordinal()
+                if day_ordinal != self._date_ordinal:
+                    self.current_date = self._format_date(local_time)
+                    # Also get weekday for old clock layout
+                    self.current_weekday = _WEEKDAY_NAMES[local_time.weekday()]
+                    self._date_ordinal = day_ordinal
             
             # Store seconds for comparison
             self.current_seconds = current_seconds
 
-            self.last_update = time.time()
+            self.last_update = now
+            self._last_tick = tick
 
         except Exception as e:
             self.logger.error(f"Error updating clock: {e}")
@@ -247,223 +430,229 @@ class SimpleClock(BasePlugin):
         Args:
             force_clear: If True, clear display before rendering
         """
+        # Nothing on screen can change until the displayed second/minute rolls over.
+        # Error paths reset _display_tick to -1 so the next call retries.
+        tick = int(time.time() // self._tick_period)
+        if tick == self._display_tick and not force_clear:
+            return
+        self._display_tick = tick
+
+        if not self.current_time:
+            self.logger.warning("Clock display called before update() - calling update() now")
+        self.update()
+
+        # Check if time/date has changed since last display
+        current_time_str = self.current_time
+        current_time_without_seconds = self.time_without_seconds
+        current_ampm_str = self.current_ampm
+        current_date_str = self.current_date if self.show_date else ''
+        current_weekday_str = self.current_weekday if self._show_weekday else ''
+        current_seconds = self.current_seconds
+        display_key = (current_time_without_seconds, current_ampm_str, current_date_str, current_weekday_str)
+        display_key_changed = display_key != self._last_display_key
+
+        # Check if only seconds changed (for partial redraw optimization)
+        only_seconds_changed = (
+            self.show_seconds and
+            current_seconds is not None and
+            self.last_seconds is not None and
+            current_seconds != self.last_seconds and
+            not display_key_changed
+        )
+
+        # Determine if we need a full redraw
+        needs_full_redraw = force_clear or display_key_changed
+
+        # If nothing changed, skip redraw
+        if not needs_full_redraw and not only_seconds_changed:
+            return
+
+        dm = self.display_manager
         try:
-            # Ensure update() has been called at least once
-            if not hasattr(self, 'current_time'):
-                self.logger.warning("Clock display called before update() - calling update() now")
-                self.update()
-            else:
-                # Update time to check if it has changed
-                self.update()
-
-            # Check if time/date has changed since last display
-            current_time_str = getattr(self, 'current_time', '')
-            current_time_without_seconds = getattr(self, 'time_without_seconds', current_time_str)
-            current_ampm_str = getattr(self, 'current_ampm', '') if self.time_format == "12h" else ''
-            current_date_str = getattr(self, 'current_date', '') if self.show_date else ''
-            current_weekday_str = getattr(self, 'current_weekday', '') if (self.show_date and self.date_format == "OLD_CLOCK") else ''
-            current_seconds = getattr(self, 'current_seconds', None)
-            
-            # Check if only seconds changed (for partial redraw optimization)
-            only_seconds_changed = (
-                self.show_seconds and
-                current_seconds is not None and
-                self.last_seconds is not None and
-                current_seconds != self.last_seconds and
-                current_time_without_seconds == self.last_time_without_seconds and
-                current_ampm_str == getattr(self, 'last_ampm_str', '') and
-                current_date_str == self.last_date_str and
-                current_weekday_str == getattr(self, 'last_weekday_str', '')
-            )
-            
-            # Determine if we need a full redraw
-            needs_full_redraw = force_clear or (
-                current_time_without_seconds != self.last_time_without_seconds or
-                current_ampm_str != getattr(self, 'last_ampm_str', '') or
-                current_date_str != self.last_date_str or
-                current_weekday_str != getattr(self, 'last_weekday_str', '')
-            )
-            
-            # Get display dimensions early (needed for both partial and full updates)
-            width = self.display_manager.width
-            height = self.display_manager.height
-            
-            # Get font height for dynamic spacing calculations
-            font_height = self.display_manager.get_font_height(self.display_manager.small_font)
-            
-            # Calculate dynamic positions based on display dimensions
-            # Time position: Small fixed offset (4px) plus small percentage for larger displays
-            # This keeps time near top on small displays, scales slightly on larger ones
-            time_y = max(2, min(4 + int(height * 0.02), int(height * 0.1)))
-            
+            # Positions for the current display size (needed for both partial and full updates)
+            layout = self._get_layout()
+
             # If only seconds changed, do partial update
             if only_seconds_changed and not force_clear:
-                self._update_seconds_only(current_time_str, time_y, width)
+                self._update_seconds_only(current_time_str, layout)
                 self.last_seconds = current_seconds
                 self.last_time_str = current_time_str
                 return
-            
-            # If nothing changed, skip redraw
-            if not needs_full_redraw and not force_clear:
-                return
 
             # Clear the display for full redraw
-            self.display_manager.clear()
+            dm.clear()
             
-            # Display time and AM/PM based on alignment toggle
-            if self.time_format == "12h" and hasattr(self, 'current_ampm') and self.center_time_with_ampm:
-                # Center time and AM/PM together as one block
-                # Calculate widths of each component
-                time_width = self.display_manager.get_text_width(
-                    self.current_time,
-                    self.display_manager.small_font
-                )
-                space_width = self.display_manager.get_text_width(
-                    " ",
-                    self.display_manager.small_font
-                )
-                ampm_width = self.display_manager.get_text_width(
-                    self.current_ampm,
-                    self.display_manager.small_font
-                )
-                
-                # Total width of "Time AM/PM" block
-                total_width = time_width + space_width + ampm_width
-                
-                # Calculate x position to center the entire "Time AM/PM" block
-                time_x = (width - total_width) // 2
-                
-                # Draw time at calculated position
-                self.display_manager.draw_text(
-                    self.current_time,
-                    x=time_x,
-                    y=time_y,
-                    color=self.time_color,
-                    small_font=True
-                )
-                
-                # Draw AM/PM right after time with proper spacing
-                ampm_x = time_x + time_width + space_width
-                self.display_manager.draw_text(
-                    self.current_ampm,
-                    x=ampm_x,
-                    y=time_y,
-                    color=self.ampm_color,
-                    small_font=True
-                )
-            else:
-                # Default behavior: center time first, then add AM/PM to the right
-                # Draw time (large, centered, near top)
-                self.display_manager.draw_text(
-                    self.current_time,
-                    y=time_y,
-                    color=self.time_color,
-                    small_font=True
-                )
-
-                # Display AM/PM indicator (12h format only) - positioned next to time
-                if self.time_format == "12h" and hasattr(self, 'current_ampm'):
-                    # Calculate AM/PM position: to the right of centered time
-                    # Use the same font that's used for drawing (small_font)
-                    time_width = self.display_manager.get_text_width(
-                        self.current_time, 
-                        self.display_manager.small_font
-                    )
-                    
-                    # Spacing between time and AM/PM: ~2.5% of width, minimum 2px
-                    ampm_spacing = max(2, int(width * 0.025))
-                    ampm_x = (width + time_width) // 2 + ampm_spacing
-                    self.display_manager.draw_text(
-                        self.current_ampm,
-                        x=ampm_x,
-                        y=time_y,  # Align with time
-                        color=self.ampm_color,
-                        small_font=True
-                    )
+            # Display time (and AM/PM) using the renderer chosen for this config
+            self._draw_time_impl(layout)
 
             # Display date
-            if self.show_date and hasattr(self, 'current_date'):
-                if self.date_format == "OLD_CLOCK" and hasattr(self, 'current_weekday'):
-                    # Calculate date positions dynamically from bottom
-                    # This ensures consistent positioning relative to bottom edge
-                    # Weekday: ~18px from bottom (scales with display size)
-                    weekday_offset = max(18, int(height * 0.28))
-                    weekday_y = height - weekday_offset
-                    
-                    # Date: ~9px from bottom (scales with display size)
-                    date_offset = max(9, int(height * 0.14))
-                    date_y = height - date_offset
-                    
-                    # Ensure minimum spacing between lines (at least 1 font height)
-                    min_line_spacing = font_height + 1
-                    if date_y - weekday_y < min_line_spacing:
-                        # Adjust to maintain minimum spacing
-                        date_y = weekday_y + min_line_spacing
-                        # Don't go past bottom of display
-                        if date_y >= height:
-                            date_y = height - 1
-                    
-                    # Weekday on first line
-                    self.display_manager.draw_text(
-                        self.current_weekday,
-                        y=weekday_y,
-                        color=self.date_color,
-                        small_font=True
-                    )
-                    # Month and day on second line
-                    self.display_manager.draw_text(
-                        self.current_date,
-                        y=date_y,
-                        color=self.date_color,
-                        small_font=True
-                    )
-                else:
-                    # Other date formats: single line centered near bottom
-                    # Position ~9px from bottom (scales with display size)
-                    date_offset = max(9, int(height * 0.14))
-                    date_y = height - date_offset
-                    self.display_manager.draw_text(
-                        self.current_date,
-                        y=date_y,
-                        color=self.date_color,
-                        small_font=True
-                    )
+            if self._draw_date_impl is not None and self.current_date:
+                self._draw_date_impl(layout)
 
             # Update the physical display
-            self.display_manager.update_display()
+            dm.update_display()
             
             # Track what we just displayed
             self.last_time_str = current_time_str
-            self.last_time_without_seconds = current_time_without_seconds
             self.last_seconds = current_seconds
-            if self.time_format == "12h":
-                self.last_ampm_str = current_ampm_str
-            self.last_date_str = current_date_str
-            if self.show_date and self.date_format == "OLD_CLOCK":
-                self.last_weekday_str = current_weekday_str
+            self._last_display_key = display_key
             
-            display_str = f"{current_time_str} {current_ampm_str}".strip()
-            self.logger.debug(f"Clock displayed: {display_str} {current_date_str}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                display_str = f"{current_time_str} {current_ampm_str}".strip()
+                self.logger.debug("Clock displayed: %s %s", display_str, current_date_str)
 
         except Exception as e:
-            self.logger.error(f"Error displaying clock: {e}", exc_info=True)
+            # Only pay for traceback formatting when debugging
+            self.logger.error(f"Error displaying clock: {e}",
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
+            self._display_tick = -1
             # Show error message on display
             try:
-                self.display_manager.clear()
-                self.display_manager.draw_text(
+                dm.clear()
+                dm.draw_text(
                     "Clock Error",
                     x=5, y=15,
                     color=(255, 0, 0)
                 )
-                self.display_manager.update_display()
+                dm.update_display()
             except:
                 pass  # If display fails, don't crash
 
-    def _update_seconds_only(self, current_time_str: str, time_y: int, width: int) -> None:
+    def _get_layout(self) -> _ClockLayout:
+        """Get element positions, recomputed only when the display size or font changes."""
+        dm = self.display_manager
+        key = (dm.width, dm.height, dm.small_font)
+        if key != self._layout_key:
+            self._layout = self._compute_layout(key[0], key[1])
+            self._layout_key = key
+        return self._layout
+
+    def _compute_layout(self, width: int, height: int) -> _ClockLayout:
+        """Calculate dynamic positions based on display dimensions."""
+        # Get font height for dynamic spacing calculations
+        font_height = self.display_manager.get_font_height(self.display_manager.small_font)
+
+        # Time position: Small fixed offset (4px) plus small percentage for larger displays
+        # This keeps time near top on small displays, scales slightly on larger ones
+        time_y = max(2, min(4 + int(height * 0.02), int(height * 0.1)))
+
+        # Spacing between time and AM/PM: ~2.5% of width, minimum 2px
+        ampm_spacing = max(2, int(width * 0.025))
+
+        # Calculate date positions dynamically from bottom
+        # This ensures consistent positioning relative to bottom edge
+        # Weekday: ~18px from bottom (scales with display size)
+        weekday_offset = max(18, int(height * 0.28))
+        weekday_y = height - weekday_offset
+
+        # Date: ~9px from bottom (scales with display size)
+        date_offset = max(9, int(height * 0.14))
+        date_y = height - date_offset
+
+        # OLD_CLOCK: ensure minimum spacing between lines (at least 1 font height)
+        two_line_date_y = date_y
+        min_line_spacing = font_height + 1
+        if two_line_date_y - weekday_y < min_line_spacing:
+            # Adjust to maintain minimum spacing
+            two_line_date_y = weekday_y + min_line_spacing
+            # Don't go past bottom of display
+            if two_line_date_y >= height:
+                two_line_date_y = height - 1
+
+        return _ClockLayout(width, height, font_height, time_y, ampm_spacing,
+                            weekday_y, two_line_date_y, date_y)
+
+    def _draw_time_centered_with_ampm(self, layout: _ClockLayout) -> None:
+        """Draw time and AM/PM centered together as one block."""
+        draw_text = self.display_manager.draw_text
+        # Calculate widths of each component
+        time_width = self._get_text_width(self.current_time)
+        space_width = self._get_text_width(" ")
+        ampm_width = self._get_text_width(self.current_ampm)
+
+        # Total width of "Time AM/PM" block
+        total_width = time_width + space_width + ampm_width
+
+        # Calculate x position to center the entire "Time AM/PM" block
+        time_x = (layout.width - total_width) // 2
+
+        # Draw time at calculated position
+        draw_text(
+            self.current_time,
+            x=time_x,
+            y=layout.time_y,
+            color=self.time_color,
+            small_font=True
+        )
+
+        # Draw AM/PM right after time with proper spacing
+        ampm_x = time_x + time_width + space_width
+        draw_text(
+            self.current_ampm,
+            x=ampm_x,
+            y=layout.time_y,
+            color=self.ampm_color,
+            small_font=True
+        )
+
+    def _draw_time_with_ampm(self, layout: _ClockLayout) -> None:
+        """Draw centered time with the AM/PM indicator to its right."""
+        self._draw_time_only(layout)
+
+        # Calculate AM/PM position: to the right of centered time
+        # Use the same font that's used for drawing (small_font)
+        time_width = self._get_text_width(self.current_time)
+        ampm_x = (layout.width + time_width) // 2 + layout.ampm_spacing
+        self.display_manager.draw_text(
+            self.current_ampm,
+            x=ampm_x,
+            y=layout.time_y,  # Align with time
+            color=self.ampm_color,
+            small_font=True
+        )
+
+    def _draw_time_only(self, layout: _ClockLayout) -> None:
+        """Draw time (large, centered, near top)."""
+        self.display_manager.draw_text(
+            self.current_time,
+            y=layout.time_y,
+            color=self.time_color,
+            small_font=True
+        )
+
+    def _draw_date_old_clock(self, layout: _ClockLayout) -> None:
+        """Draw weekday and month/day on two lines near the bottom."""
+        draw_text = self.display_manager.draw_text
+        # Weekday on first line
+        draw_text(
+            self.current_weekday,
+            y=layout.weekday_y,
+            color=self.date_color,
+            small_font=True
+        )
+        # Month and day on second line
+        draw_text(
+            self.current_date,
+            y=layout.two_line_date_y,
+            color=self.date_color,
+            small_font=True
+        )
+
+    def _draw_date_single_line(self, layout: _ClockLayout) -> None:
+        """Draw the date on a single centered line near the bottom."""
+        self.display_manager.draw_text(
+            self.current_date,
+            y=layout.date_y,
+            color=self.date_color,
+            small_font=True
+        )
+
+    def _update_seconds_only(self, current_time_str: str, layout: _ClockLayout) -> None:
         """
         Update only the seconds portion of the time display without clearing the entire screen.
         This optimizes performance when only seconds change.
         """
+        dm = self.display_manager
         try:
             # Extract seconds from time string (format: "H:MM:SS" or "HH:MM:SS")
             if ':' in current_time_str:
@@ -474,95 +663,79 @@ class SimpleClock(BasePlugin):
                     # Get time without seconds for positioning
                     time_without_seconds = ':'.join(parts[:-1])
                     
-                    # Calculate position of seconds
-                    # Seconds always come right after the time (without seconds)
-                    time_without_seconds_width = self.display_manager.get_text_width(
-                        time_without_seconds,
-                        self.display_manager.small_font
-                    )
+                    # Seconds start right after "H:MM:" within the time string as drawn
+                    seconds_offset = self._get_text_width(time_without_seconds + ':')
                     
-                    # Calculate seconds position based on alignment mode
-                    if self.time_format == "12h" and hasattr(self, 'current_ampm') and self.center_time_with_ampm:
+                    # Calculate where the full time string starts based on alignment mode
+                    time_width = self._get_text_width(current_time_str)
+                    if self._center_ampm_block and self.current_ampm:
                         # Time and AM/PM are centered together as one block
-                        time_width = self.display_manager.get_text_width(
-                            self.current_time,
-                            self.display_manager.small_font
-                        )
-                        space_width = self.display_manager.get_text_width(
-                            " ",
-                            self.display_manager.small_font
-                        )
-                        ampm_width = self.display_manager.get_text_width(
-                            self.current_ampm,
-                            self.display_manager.small_font
-                        )
+                        space_width = self._get_text_width(" ")
+                        ampm_width = self._get_text_width(self.current_ampm)
                         total_width = time_width + space_width + ampm_width
-                        time_x = (width - total_width) // 2
-                        # Seconds come right after time_without_seconds (before AM/PM)
-                        seconds_x = time_x + time_without_seconds_width + 1  # +1 for colon
+                        time_x = (layout.width - total_width) // 2
                     else:
-                        # Time is centered, seconds come right after centered time
-                        # When time is centered, the x position is calculated as: (width - time_width) // 2
-                        # So seconds_x = centered_time_x + time_without_seconds_width + 1
-                        centered_time_x = (width - time_without_seconds_width) // 2
-                        seconds_x = centered_time_x + time_without_seconds_width + 1  # +1 for colon
+                        # Time is drawn centered on its own (draw_text centers when no x is given)
+                        time_x = (layout.width - time_width) // 2
+                    seconds_x = time_x + seconds_offset
                     
-                    # Draw a small rectangle to clear just the seconds area (with some padding)
-                    seconds_width = self.display_manager.get_text_width(
-                        seconds_str,
-                        self.display_manager.small_font
-                    )
-                    # Clear area (slightly larger to ensure clean update)
-                    clear_x = seconds_x - 1
-                    clear_y = time_y - 1
-                    clear_width = seconds_width + 2
-                    clear_height = self.display_manager.get_font_height(self.display_manager.small_font) + 2
+                    # Draw a small rectangle to clear just the seconds area (vertical padding only,
+                    # so the colon before it and the AM/PM after it are left intact)
+                    seconds_width = self._get_text_width(seconds_str)
+                    clear_x = seconds_x
+                    clear_y = layout.time_y - 1
+                    clear_height = layout.font_height + 2
                     
                     # Draw black rectangle to clear seconds area
-                    self.display_manager.draw.rectangle(
-                        [clear_x, clear_y, clear_x + clear_width, clear_y + clear_height],
+                    dm.draw.rectangle(
+                        [clear_x, clear_y, clear_x + seconds_width - 1, clear_y + clear_height],
                         fill=(0, 0, 0)
                     )
                     
                     # Redraw seconds
-                    self.display_manager.draw_text(
+                    dm.draw_text(
                         seconds_str,
                         x=seconds_x,
-                        y=time_y,
+                        y=layout.time_y,
                         color=self.time_color,
                         small_font=True
                     )
                     
                     # Update display
-                    self.display_manager.update_display()
+                    dm.update_display()
                     
-                    self.logger.debug(f"Updated seconds only: {seconds_str}")
+                    self.logger.debug("Updated seconds only: %s", seconds_str)
         except Exception as e:
             self.logger.warning(f"Error updating seconds only, falling back to full redraw: {e}")
             # Fall back to full redraw on error
-            self.display_manager.clear()
-            # Trigger full redraw by setting needs_redraw
-            self.last_time_without_seconds = None
+            dm.clear()
+            # Trigger full redraw on the next display() call
+            self._last_display_key = None
+            self._display_tick = -1
 
     def get_display_duration(self) -> float:
         """Get display duration from config."""
         return self.config.get('display_duration', 15.0)
 
     def validate_config(self) -> bool:
-        """Validate plugin configuration."""
+        """Validate plugin configuration (checked once; config is fixed per instance)."""
+        if self._config_valid is None:
+            self._config_valid = self._check_config()
+        return self._config_valid
+
+    def _check_config(self) -> bool:
+        """Run the configuration checks behind validate_config()."""
         # Call parent validation first
         if not super().validate_config():
             return False
 
         # Validate timezone
-        if pytz is not None:
-            try:
-                pytz.timezone(self.timezone_str)
-            except Exception:
-                self.logger.error(f"Invalid timezone: {self.timezone_str}")
-                return False
-        else:
-            self.logger.warning("pytz not available, timezone validation skipped")
+        # _get_timezone() already resolved the name in __init__
+        if self._timezone_valid is None:
+            self.logger.warning("No timezone database available, timezone validation skipped")
+        elif not self._timezone_valid:
+            self.logger.error(f"Invalid timezone: {self.timezone_str}")
+            return False
 
         # Validate time format
         if self.time_format not in ["12h", "24h"]:
@@ -575,35 +748,24 @@ class SimpleClock(BasePlugin):
             return False
 
         # Validate colors
-        for color_name, color_value in [
-            ("time_color", self.time_color),
-            ("date_color", self.date_color),
-            ("ampm_color", self.ampm_color)
-        ]:
+        for color_name in self._COLOR_ATTRS:
+            color_value = getattr(self, color_name)
             if not isinstance(color_value, tuple) or len(color_value) != 3:
                 self.logger.error(f"Invalid {color_name}: must be RGB tuple")
                 return False
-            try:
-                # Convert to integers and validate range
-                color_ints = [int(c) for c in color_value]
-                if not all(0 <= c <= 255 for c in color_ints):
-                    self.logger.error(f"Invalid {color_name}: values must be 0-255")
-                    return False
-            except (ValueError, TypeError):
+            # __init__ converts parseable channels to int, so anything else is non-numeric
+            if not all(type(c) is int for c in color_value):
                 self.logger.error(f"Invalid {color_name}: values must be numeric")
                 return False
+            if not all(0 <= c <= 255 for c in color_value):
+                self.logger.error(f"Invalid {color_name}: values must be 0-255")
+                return False
 
         return True
 
     def get_info(self) -> Dict[str, Any]:
         """Return plugin info for web UI."""
         info = super().get_info()
-        info.update({
-            'current_time': getattr(self, 'current_time', None),
-            'timezone': self.timezone_str,
-            'time_format': self.time_format,
-            'show_seconds': self.show_seconds,
-            'show_date': self.show_date,
-            'date_format': self.date_format
-        })
+        info.update(self._static_info)
+        info['current_time'] = self.current_time or None
         return info